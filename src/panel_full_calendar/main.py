@@ -1,34 +1,137 @@
 """Implements FullCalendar within Panel."""
 
 import asyncio
+import bisect
 import datetime
-import json
+import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 from typing import Literal
 
+import numpy as np
+import pandas as pd
 import param
 from panel.custom import JSComponent
 
-from .utils import normalize_datetimes
+from .utils import parse_datetimes
 from .utils import to_camel_case
 from .utils import to_camel_case_keys
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is installed in the test environments
+    import json as _json
+
 THIS_DIR = Path(__file__).parent
 MODELS_DIR = THIS_DIR / "models"
-VIEW_DEFAULT_deltaS = {
-    "dayGridMonth": {"days": 1},
-    "dayGridWeek": {"weeks": 1},
-    "dayGridDay": {"days": 1},
-    "timeGridWeek": {"weeks": 1},
-    "timeGridDay": {"days": 1},
-    "listWeek": {"weeks": 1},
-    "listMonth": {"months": 1},
-    "listYear": {"years": 1},
-    "multiMonthYear": {"years": 1},
+VIEW_DEFAULT_deltaS = MappingProxyType(
+    {
+        "dayGridMonth": {"days": 1},
+        "dayGridWeek": {"weeks": 1},
+        "dayGridDay": {"days": 1},
+        "timeGridWeek": {"weeks": 1},
+        "timeGridDay": {"days": 1},
+        "listWeek": {"weeks": 1},
+        "listMonth": {"months": 1},
+        "listYear": {"years": 1},
+        "multiMonthYear": {"years": 1},
+    }
+)
+_WATCHED_PARAMS = (
+    "all_day_maintain_duration",
+    "aspect_ratio",
+    "business_hours",
+    "button_icons",
+    "button_text",
+    "date_alignment",
+    "date_delta",
+    "day_max_event_rows",
+    "day_max_events",
+    "day_popover_format",
+    "display_event_end",
+    "display_event_time",
+    "drag_revert_duration",
+    "drag_scroll",
+    "editable",
+    "event_background_color",
+    "event_border_color",
+    "event_color",
+    "event_display",
+    "event_drag_min_distance",
+    "event_duration_editable",
+    "event_max_stack",
+    "event_order",
+    "event_order_strict",
+    "event_resizable_from_start",
+    "event_start_editable",
+    "event_text_color",
+    "event_time_format",
+    "expand_rows",
+    "footer_toolbar",
+    "handle_window_resize",
+    "header_toolbar",
+    "more_link_click",
+    "multi_month_max_columns",
+    "nav_links",
+    "next_day_threshold",
+    "now_indicator",
+    "progressive_event_rendering",
+    "selectable",
+    "select_mirror",
+    "unselect_auto",
+    "unselect_cancel",
+    "select_allow",
+    "select_min_distance",
+    "show_non_current_dates",
+    "snap_duration",
+    "sticky_footer_scrollbar",
+    "sticky_header_dates",
+    "time_zone",
+    "title_format",
+    "title_range_separator",
+    "valid_range",
+    "value",
+    "window_resize_delay",
+)
+# "value" is sent as FullCalendar's "events" option
+_CAMEL_NAMES = {name: "events" if name == "value" else to_camel_case(name) for name in _WATCHED_PARAMS}
+_CALLBACK_NAMES = {
+    key: f"{key}_callback"
+    for key in (
+        "date_click",
+        "event_change",
+        "event_click",
+        "event_drag_start",
+        "event_drag_stop",
+        "event_drop",
+        "event_remove",
+        "event_resize",
+        "event_resize_start",
+        "event_resize_stop",
+        "select",
+        "unselect",
+    )
 }
 
 
-class Calendar(JSComponent):
+class _CalendarState:
+    """Slotted storage for the internal caches and flags of a Calendar."""
+
+    __slots__ = (
+        "_applying_frontend_edit",
+        "_event_index",
+        "_event_index_removed",
+        "_event_index_source",
+        "_flush_scheduled",
+        "_pending_updates",
+        "_synced_value",
+        "_view_columns",
+        "_view_days",
+    )
+
+
+class Calendar(_CalendarState, JSComponent):
     """
     The Calendar widget is a wrapper around the FullCalendar library.
 
@@ -452,65 +555,17 @@ class Calendar(JSComponent):
         self._assign_id_to_events()
 
         self._buffer = []
-        self.param.watch(
-            self._update_options,
-            [
-                "all_day_maintain_duration",
-                "aspect_ratio",
-                "business_hours",
-                "button_icons",
-                "button_text",
-                "date_alignment",
-                "date_delta",
-                "day_max_event_rows",
-                "day_max_events",
-                "day_popover_format",
-                "display_event_end",
-                "display_event_time",
-                "drag_revert_duration",
-                "drag_scroll",
-                "editable",
-                "event_background_color",
-                "event_border_color",
-                "event_color",
-                "event_display",
-                "event_drag_min_distance",
-                "event_duration_editable",
-                "event_max_stack",
-                "event_order",
-                "event_order_strict",
-                "event_resizable_from_start",
-                "event_start_editable",
-                "event_text_color",
-                "event_time_format",
-                "expand_rows",
-                "footer_toolbar",
-                "handle_window_resize",
-                "header_toolbar",
-                "more_link_click",
-                "multi_month_max_columns",
-                "nav_links",
-                "next_day_threshold",
-                "now_indicator",
-                "progressive_event_rendering",
-                "selectable",
-                "select_mirror",
-                "unselect_auto",
-                "unselect_cancel",
-                "select_allow",
-                "select_min_distance",
-                "show_non_current_dates",
-                "snap_duration",
-                "sticky_footer_scrollbar",
-                "sticky_header_dates",
-                "time_zone",
-                "title_format",
-                "title_range_separator",
-                "valid_range",
-                "value",
-                "window_resize_delay",
-            ],
-        )
+        self._event_index: dict[str, int] | None = None
+        self._event_index_removed: list[int] = []
+        self._event_index_source: list[dict] | None = None
+        self._view_columns: tuple[pd.DatetimeIndex, pd.DatetimeIndex, np.ndarray, np.ndarray] | None = None
+        self._view_days: tuple[pd.DatetimeIndex, pd.DatetimeIndex] | None = None
+        self._pending_updates: dict[str, Any] = {}
+        self._flush_scheduled = False
+        # the events list the frontend currently holds
+        self._synced_value: list[dict] | None = self.value
+        self._applying_frontend_edit = False
+        self.param.watch(self._update_options, list(_WATCHED_PARAMS))
 
     def click_next(self) -> None:
         """Click the next button through the calendar's UI."""
@@ -633,7 +688,21 @@ class Calendar(JSComponent):
         if display is not None:
             event["display"] = display
         event.update(kwargs)
-        self.value = self.value + [event]
+        for key, val in event.items():
+            # share repeated short strings such as display modes and recurring titles;
+            # sys.intern rejects str subclasses such as numpy.str_
+            if type(val) is str and len(val) < 32:
+                event[key] = sys.intern(val)
+        self._assign_id_to_event(event)
+        events = self.value + [event]
+        # if the frontend holds the current events, it can add the event directly
+        # instead of receiving every event again
+        incremental = self.value is self._synced_value
+        if incremental:
+            self._synced_value = events
+        self.value = events
+        if incremental:
+            self._send_msg({"type": "addEvent", "event": event})
 
     def add_events(self, events: list[dict]) -> None:
         """
@@ -655,6 +724,9 @@ class Calendar(JSComponent):
         """
         Get an event from the calendar.
 
+        An event whose start is exactly the given string is returned before
+        any event that only matches once both starts are parsed as dates.
+
         Args:
             start: The start of the event.
                 Supports ISO 8601 date strings, datetime/date objects, and int in milliseconds.
@@ -664,87 +736,187 @@ class Calendar(JSComponent):
         Returns:
             Event: The event with the given start and title.
         """
-        for event in self.events_in_view:  # type: ignore
-            norm_start, event_start = normalize_datetimes(start, event["start"])  # type: ignore
+        events = self.events_in_view
+        if events and isinstance(start, str):
+            # callers usually pass back the exact string the frontend reported,
+            # which can be matched without parsing any dates
+            for event in events:
+                if event["start"] == start and event.get("title") == title:
+                    return self._create_calendar_event(event)
+        if events:
+            if self._view_columns is None:
+                wall, utc, aware = parse_datetimes([event["start"] for event in events])  # type: ignore
+                titles = np.array([event.get("title") for event in events], dtype=object)  # type: ignore
+                self._view_columns = wall, utc, aware, titles
+            wall, utc, aware, titles = self._view_columns
+            norm_start = pd.to_datetime(start)
+            start_wall = norm_start.tz_localize(None)
+            start_utc = norm_start.tz_convert("UTC") if norm_start.tz is not None else None
             if match_by_time:
-                norm_start = norm_start.date()
-                event_start = event_start.date()
-            if norm_start != event_start or event["title"] != title:
-                continue
-            return CalendarEvent(
-                id=event["id"],
-                title=event["title"],
-                start=event["start"],
-                end=event.get("end"),
-                all_day=event.get("allDay"),
-                calendar=self,
-            )
+                if self._view_days is None:
+                    self._view_days = wall.normalize(), utc.normalize()
+                wall, utc = self._view_days
+                start_wall = start_wall.normalize()
+                start_utc = start_utc.normalize() if start_utc is not None else None
+            mask = np.asarray(wall == start_wall)
+            if start_utc is not None:
+                # offset-aware events compare as instants, naive ones by wall time in the start's zone
+                mask = np.where(aware, utc == start_utc, mask)
+            mask &= titles == title
+            # argmax stops at the first match instead of collecting every index
+            index = int(mask.argmax())
+            if mask[index]:
+                return self._create_calendar_event(events[index])
         raise ValueError(f"No event found with start {start} and title {title}.")
 
+    def _create_calendar_event(self, event: dict) -> "CalendarEvent":
+        return CalendarEvent(
+            id=event["id"],
+            title=event["title"],
+            start=event["start"],
+            end=event.get("end"),
+            all_day=event.get("allDay"),
+            calendar=self,
+        )
+
     def clear_events(self) -> None:
         """Clear all events from the calendar."""
         self.value = []
 
     def _handle_msg(self, msg):
         if "events_in_view" in msg:
-            events = json.loads(msg["events_in_view"])
+            events = _json.loads(msg["events_in_view"])
             with param.edit_constant(self):
                 self.events_in_view = events
         elif "current_date" in msg:
-            current_date_info = json.loads(msg["current_date"])
+            current_date_info = _json.loads(msg["current_date"])
             with param.edit_constant(self):
                 self.current_date = current_date_info["startStr"]
             if self.current_date_callback:
                 self.current_date_callback(current_date_info)
         elif "current_view" in msg:
-            current_view_info = json.loads(msg["current_view"])
+            current_view_info = _json.loads(msg["current_view"])
             with param.edit_constant(self):
                 self.current_view = current_view_info["view"]["type"]
             if self.current_view_callback:
                 self.current_view_callback(current_view_info)
         else:
-            key = list(msg.keys())[0]
-            callback_name = f"{key}_callback"
+            key = next(iter(msg))
+            callback_name = _CALLBACK_NAMES.get(key) or f"{key}_callback"
             if hasattr(self, callback_name):
-                info = json.loads(msg[key])
+                info = _json.loads(msg[key])
                 if callback_name == "event_change_callback":
                     new_event = info["event"]
-                    for value in self.value:
-                        if value["id"] != new_event["id"]:
-                            continue
-                        value.update(new_event)
-                        break
-                    self.param.trigger("value")
+                    index = self._find_event_index(new_event["id"])
+                    if index is not None:
+                        self.value[index].update(new_event)
+                    self._trigger_frontend_edit()
                 elif callback_name == "event_remove_callback":
                     removed_event = info["event"]
-                    for value in self.value:
-                        if value["id"] != removed_event["id"]:
-                            continue
-                        self.value.remove(value)
-                        break
-                    self.param.trigger("value")
+                    index = self._find_event_index(removed_event["id"])
+                    if index is not None:
+                        del self.value[index]
+                        self._drop_from_event_index(removed_event["id"])
+                    self._trigger_frontend_edit()
                 callback = getattr(self, callback_name)
                 if callback:
                     callback(info)
             else:
                 raise RuntimeError(f"Unhandled message: {msg}")
 
+    def _trigger_frontend_edit(self):
+        # the frontend made this in-place edit itself, so unless it is waiting
+        # for a full events update it already holds the triggered list
+        self._applying_frontend_edit = True
+        try:
+            self.param.trigger("value")
+        finally:
+            self._applying_frontend_edit = False
+
     def _update_options(self, *events):
-        updates = [
-            {
-                "key": ("events" if to_camel_case(event.name) == "value" else to_camel_case(event.name)),
-                "value": event.new,
-            }
-            for event in events
-        ]
-        self._send_msg({"type": "updateOptions", "updates": updates})
+        for event in events:
+            if event.name == "value" and event.new is self._synced_value and (event.type != "triggered" or self._applying_frontend_edit):
+                continue
+            self._pending_updates[_CAMEL_NAMES[event.name]] = event.new
+        if not self._pending_updates or self._flush_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_updates()
+            return
+        # coalesce changes made within the same tick into a single message
+        self._flush_scheduled = True
+        loop.call_soon(self._flush_updates)
+
+    def _send_msg(self, data):
+        # deliver option updates queued earlier in the tick first, so the
+        # frontend applies everything in the order it was requested
+        if self._pending_updates:
+            self._flush_updates()
+        super()._send_msg(data)
+
+    def _flush_updates(self):
+        self._flush_scheduled = False
+        updates = [{"key": key, "value": value} for key, value in self._pending_updates.items()]
+        if "events" in self._pending_updates:
+            self._synced_value = self._pending_updates["events"]
+        self._pending_updates.clear()
+        if updates:
+            self._send_msg({"type": "updateOptions", "updates": updates})
+
+    def _find_event_index(self, event_id: str) -> int | None:
+        events = self.value
+        if self._event_index is None or self._event_index_source is not events:
+            self._event_index = {}
+            for i, event in enumerate(events):
+                self._event_index.setdefault(event.get("id"), i)
+            self._event_index_removed.clear()
+            self._event_index_source = events
+        position = self._event_index.get(event_id)
+        if position is not None:
+            # shift back past the events removed since the index was built
+            index = position - bisect.bisect_left(self._event_index_removed, position)
+            if index < len(events) and events[index].get("id") == event_id:
+                return index
+        # the list was edited in place, e.g. ids were assigned after the index was built
+        for i, event in enumerate(events):
+            if event.get("id") == event_id:
+                self._event_index = None
+                return i
+        return None
+
+    def _drop_from_event_index(self, event_id: str):
+        position = self._event_index.pop(event_id, None) if self._event_index else None
+        if position is None:
+            self._event_index = None
+        else:
+            bisect.insort(self._event_index_removed, position)
+
+    @param.depends("events_in_view", watch=True)
+    def _reset_view_columns(self):
+        self._view_columns = None
+        self._view_days = None
+
+    @staticmethod
+    def _assign_id_to_event(event: dict, camel_keys: dict[str, str] | None = None):
+        # avoid formatting a fallback id for events that already have one
+        if "id" not in event:
+            event["id"] = str(id(event))
+        # most events are already camelCased, so only rename the keys of those that are not;
+        # renaming in place keeps the dicts callers still hold in sync with value
+        if camel_keys is not None and any("_" in key for key in event):
+            for key in list(event.keys()):
+                camel_key = camel_keys.get(key)
+                if camel_key is None:
+                    camel_key = camel_keys[key] = to_camel_case(key)
+                event[camel_key] = event.pop(key)
 
     def _assign_id_to_events(self):
+        # share key conversions across all the events of one assignment
+        camel_keys: dict[str, str] | None = {} if self.event_keys_auto_camel_case else None
         for event in self.value:
-            event["id"] = event.get("id", str(id(event)))
-            if self.event_keys_auto_camel_case:
-                for key in list(event.keys()):
-                    event[to_camel_case(key)] = event.pop(key)
+            self._assign_id_to_event(event, camel_keys)
 
     @param.depends("value", watch=True)
     async def _update_events_in_view(self):
@@ -800,17 +972,18 @@ class CalendarEvent(param.Parameterized):
 
     def set_props(self, **kwargs):
         """Modifies any of the non-date-related properties of the event."""
-        updates = kwargs.copy()
+        updates = kwargs
         if self.calendar.event_keys_auto_camel_case:
             updates = to_camel_case_keys(kwargs)
 
+        # kwargs may be the dict that is sent, so leave it unmodified
         self.calendar._send_msg({"type": "setProp", "id": self.id, "updates": updates})
         with param.edit_constant(self):
             if "title" in kwargs:
-                self.title = kwargs.pop("title")
+                self.title = kwargs["title"]
             if "allDay" in kwargs:
-                self.all_day = kwargs.pop("allDay")
-            self.props.update(kwargs)
+                self.all_day = kwargs["allDay"]
+            self.props.update({key: val for key, val in kwargs.items() if key not in ("title", "allDay")})
 
     def set_start(self, start: str | datetime.datetime | datetime.date | int):
         """Update the start of the event."""
@@ -180,7 +180,10 @@ export function render({ model, el }) {
         updateEventsInView()
       }
       // Event manipulation handlers
-      else if (event.type === "removeEvent") {
+      else if (event.type === "addEvent") {
+        // add to the events source so a later full events update replaces it
+        calendar.addEvent(event.event, true)
+      } else if (event.type === "removeEvent") {
         const calendarEvent = calendar.getEventById(event.id);
         if (calendarEvent) {
           calendarEvent.remove();
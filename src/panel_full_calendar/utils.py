@@ -1,21 +1,34 @@
 """Utility functions for the panel_full_calendar package."""
 
 import datetime
+import functools
+import re
 
+import numpy as np
 import pandas as pd
 
+_UPPER_BOUNDARY = re.compile(r"(?=[A-Z])")
+_AWARE_PATTERN = r".*T.*(?:Z|[+-]\d{2}:?\d{2})$"
+_OFFSET_PATTERN = r"(?:Z|[+-]\d{2}:?\d{2})$"
 
+
+@functools.lru_cache(maxsize=2048)
 def to_camel_case(string: str) -> str:
     """
     Convert snake_case to camelCase.
 
+    Results are cached since event payloads reuse a small set of keys.
+
     Args:
         string (str): snake_case string
 
     Returns:
         str: camelCase string
     """
-    return "".join(word.capitalize() if i else word for i, word in enumerate(string.split("_")))
+    if "_" not in string:
+        return string
+    first, _, rest = string.partition("_")
+    return first + "".join(map(str.capitalize, rest.split("_")))
 
 
 def to_camel_case_keys(d: dict) -> dict:
@@ -26,21 +39,30 @@ def to_camel_case_keys(d: dict) -> dict:
         d (dict): dictionary with snake_case keys
 
     Returns:
-        dict: dictionary with camelCase keys
+        dict: dictionary with camelCase keys; `d` itself if no key needs converting
     """
-    return {to_camel_case(key) if "_" in key else key: val for key, val in d.items()}
+    if not any("_" in key for key in d):
+        return d
+    return {_CAMEL_CASE_KEYS.get(key) or to_camel_case(key): val for key, val in d.items()}
 
 
+@functools.lru_cache(maxsize=2048)
 def to_snake_case(string: str) -> str:
     """
     Convert camelCase to snake_case.
 
+    Results are cached since event payloads reuse a small set of keys.
+    ASCII keys take a regex fast path; other keys are converted character
+    by character so non-ASCII capitals are handled the same way.
+
     Args:
         string (str): camelCase string
 
     Returns:
         str: snake_case string
     """
+    if string.isascii():
+        return _UPPER_BOUNDARY.sub("_", string).lower()
     return "".join(f"_{char.lower()}" if char.isupper() else char for char in string)
 
 
@@ -52,9 +74,47 @@ def to_snake_case_keys(d: dict):
         d (dict): dictionary with camelCase keys
 
     Returns:
-        dict: dictionary with snake
+        dict: dictionary with snake_case keys; `d` itself if no key needs converting
     """
-    return {to_snake_case(key): val for key, val in d.items()}
+    # islower() is False for any key with a character to_snake_case would split on
+    if all(key.islower() for key in d):
+        return d
+    return {_SNAKE_CASE_KEYS.get(key) or to_snake_case(key): val for key, val in d.items()}
+
+
+# FullCalendar's event properties, see https://fullcalendar.io/docs/event-parsing
+_EVENT_KEYS = (
+    "allDay",
+    "backgroundColor",
+    "borderColor",
+    "classNames",
+    "color",
+    "constraint",
+    "daysOfWeek",
+    "display",
+    "durationEditable",
+    "editable",
+    "end",
+    "endRecur",
+    "endTime",
+    "extendedProps",
+    "groupId",
+    "id",
+    "overlap",
+    "resourceEditable",
+    "resourceId",
+    "resourceIds",
+    "start",
+    "startEditable",
+    "startRecur",
+    "startTime",
+    "textColor",
+    "title",
+    "url",
+)
+# both spellings of each key map to the target case, so known keys skip conversion
+_CAMEL_CASE_KEYS = {**{to_snake_case(key): key for key in _EVENT_KEYS}, **{key: key for key in _EVENT_KEYS}}
+_SNAKE_CASE_KEYS = {**{key: to_snake_case(key) for key in _EVENT_KEYS}, **{to_snake_case(key): to_snake_case(key) for key in _EVENT_KEYS}}
 
 
 def normalize_datetimes(
@@ -82,3 +142,22 @@ def normalize_datetimes(
     elif timestamp2.tz is not None and timestamp1.tz is None:
         timestamp1 = timestamp1.tz_localize(timestamp2.tz)
     return timestamp1, timestamp2
+
+
+def parse_datetimes(dts: list[str]) -> tuple[pd.DatetimeIndex, pd.DatetimeIndex, np.ndarray]:
+    """
+    Parse ISO 8601 datetime strings in a single vectorized pass.
+
+    Args:
+        dts (list[str]): ISO 8601 datetime strings, with or without a UTC offset
+
+    Returns:
+        tuple[pd.DatetimeIndex, pd.DatetimeIndex, np.ndarray]: wall times with any offset dropped,
+            UTC times (NaT where no offset was given), and a mask of which strings had an offset
+    """
+    strings = pd.Series(dts, dtype=object)
+    aware = strings.str.match(_AWARE_PATTERN, na=False).to_numpy(dtype=bool)
+    wall_strings = strings.where(~aware, strings.str.replace(_OFFSET_PATTERN, "", regex=True))
+    wall = pd.DatetimeIndex(pd.to_datetime(wall_strings, format="ISO8601"))
+    utc = pd.DatetimeIndex(pd.to_datetime(strings.where(aware), format="ISO8601", utc=True))
+    return wall, utc, aware
@@ -1,4 +1,13 @@
+import asyncio
+import json
+
+import numpy as np
+import param
+import pytest
+
 from panel_full_calendar import Calendar
+from panel_full_calendar import CalendarEvent
+from panel_full_calendar import main
 
 
 def test_calendar_value_snake_case():
@@ -26,6 +35,13 @@ def test_calendar_value_snake_case_disabled():
     ]
 
 
+def test_calendar_value_snake_case_in_place():
+    event = {"start": "2020-01-01", "all_day": True, "id": "6"}
+    calendar = Calendar(value=[event])
+    assert calendar.value[0] is event
+    assert event == {"start": "2020-01-01", "allDay": True, "id": "6"}
+
+
 def test_calendar_value_camel_case():
     calendar = Calendar(value=[{"start": "2020-01-01", "allDay": True, "id": "5"}])
     assert calendar.value == [{"start": "2020-01-01", "allDay": True, "id": "5"}]
@@ -43,6 +59,12 @@ def test_calendar_add_event():
     ]
 
 
+def test_calendar_add_event_str_subclass():
+    calendar = Calendar()
+    calendar.add_event(start="2020-01-01", title=np.str_("Standup"), id="1")
+    assert calendar.value == [{"start": "2020-01-01", "title": "Standup", "id": "1"}]
+
+
 def test_calendar_add_event_camel_case_precedence():
     calendar = Calendar()
     calendar.add_event(start="2020-01-01", end="2020-01-02", allDay=True, all_day=False, id="8")
@@ -53,3 +75,175 @@ def test_calendar_clear():
     calendar = Calendar(value=[{"start": "2020-01-01", "allDay": True, "id": "9"}])
     calendar.clear_events()
     assert calendar.value == []
+
+
+def test_calendar_handle_event_change():
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "10"}, {"start": "2020-01-02", "id": "11"}])
+    calendar._handle_msg({"event_change": json.dumps({"event": {"start": "2020-01-03", "id": "11"}})})
+    assert calendar.value == [{"start": "2020-01-01", "id": "10"}, {"start": "2020-01-03", "id": "11"}]
+
+
+def test_calendar_handle_msg_stdlib_json(monkeypatch):
+    monkeypatch.setattr(main, "_json", json)
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "10"}])
+    calendar._handle_msg({"event_change": json.dumps({"event": {"start": "2020-01-03", "id": "10"}})})
+    assert calendar.value == [{"start": "2020-01-03", "id": "10"}]
+
+
+def test_calendar_handle_event_remove():
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "12"}, {"start": "2020-01-02", "id": "13"}])
+    calendar._handle_msg({"event_remove": json.dumps({"event": {"start": "2020-01-01", "id": "12"}})})
+    assert calendar.value == [{"start": "2020-01-02", "id": "13"}]
+
+    calendar.add_event(start="2020-01-04", id="14")
+    calendar._handle_msg({"event_remove": json.dumps({"event": {"start": "2020-01-04", "id": "14"}})})
+    assert calendar.value == [{"start": "2020-01-02", "id": "13"}]
+
+
+def test_calendar_handle_event_remove_keeps_index():
+    calendar = Calendar(value=[{"start": f"2020-01-{day:02d}", "id": str(day)} for day in range(1, 7)])
+    for event_id in ("2", "5", "1"):
+        calendar._handle_msg({"event_remove": json.dumps({"event": {"id": event_id}})})
+    calendar._handle_msg({"event_change": json.dumps({"event": {"start": "2020-02-06", "id": "6"}})})
+    assert calendar._event_index is not None
+    assert calendar.value == [
+        {"start": "2020-01-03", "id": "3"},
+        {"start": "2020-01-04", "id": "4"},
+        {"start": "2020-02-06", "id": "6"},
+    ]
+
+    calendar.value.insert(0, {"start": "2020-01-07", "id": "7"})
+    calendar._handle_msg({"event_remove": json.dumps({"event": {"id": "4"}})})
+    assert [event["id"] for event in calendar.value] == ["7", "3", "6"]
+
+
+def test_calendar_get_event_in_view():
+    calendar = Calendar()
+    with param.edit_constant(calendar):
+        calendar.events_in_view = [
+            {"start": "2020-01-01T05:00:00Z", "title": "event", "id": "15", "allDay": False},
+            {"start": "2020-01-02T00:00:00-05:00", "title": "other", "id": "16", "allDay": False},
+            {"start": "2020-01-02T00:00:00-05:00", "title": "event", "id": "17", "allDay": False},
+        ]
+    assert calendar.get_event_in_view("2020-01-01T00:00:00-05:00", "event").id == "15"
+    assert calendar.get_event_in_view("2020-01-02T05:00:00Z", "event").id == "17"
+    assert calendar.get_event_in_view("2020-01-02T00:00:00", "event").id == "17"
+    assert calendar.get_event_in_view("2020-01-02", "event", match_by_time=True).id == "17"
+    with pytest.raises(ValueError):
+        calendar.get_event_in_view("2020-01-03", "event")
+
+    with param.edit_constant(calendar):
+        calendar.events_in_view = [{"start": "2020-01-03", "title": "event", "id": "20", "allDay": True}]
+    assert calendar.get_event_in_view("2020-01-03", "event").id == "20"
+
+
+async def test_calendar_update_options_coalesced():
+    calendar = Calendar()
+    messages = []
+    calendar._send_msg = messages.append
+    calendar.editable = True
+    calendar.button_text = {"today": "Today"}
+    calendar.editable = False
+    assert messages == []
+
+    await asyncio.sleep(0)
+    assert messages == [
+        {
+            "type": "updateOptions",
+            "updates": [{"key": "editable", "value": False}, {"key": "buttonText", "value": {"today": "Today"}}],
+        }
+    ]
+
+
+async def test_calendar_update_options_flushed_before_messages():
+    calendar = Calendar()
+    messages = []
+    calendar._send_event = lambda event, data: messages.append(data)
+    calendar.editable = True
+    calendar.go_to_date("2020-01-01")
+    assert messages == [
+        {"type": "updateOptions", "updates": [{"key": "editable", "value": True}]},
+        {"type": "gotoDate", "date": "2020-01-01"},
+    ]
+
+    await asyncio.sleep(0)
+    assert len(messages) == 2
+
+
+def test_calendar_add_event_message():
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "18"}])
+    messages = []
+    calendar._send_msg = messages.append
+    calendar.add_event(start="2020-01-02", title="event", id="19")
+    assert {"type": "addEvent", "event": {"start": "2020-01-02", "title": "event", "id": "19"}} in messages
+    assert not any(msg["type"] == "updateOptions" for msg in messages)
+
+    messages.clear()
+    calendar.value = []
+    assert {"type": "updateOptions", "updates": [{"key": "events", "value": []}]} in messages
+
+
+async def test_calendar_add_event_after_clear():
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "1"}])
+    messages = []
+    calendar._send_event = lambda event, data: messages.append(data)
+    calendar.clear_events()
+    calendar.add_event(start="2020-01-02", id="2")
+    await asyncio.sleep(0)
+    event = {"start": "2020-01-02", "title": "(no title)", "id": "2"}
+    assert {"type": "updateOptions", "updates": [{"key": "events", "value": [event]}]} in messages
+    assert not any(msg["type"] == "addEvent" for msg in messages)
+
+
+def test_calendar_add_event_batched():
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "1"}])
+    messages = []
+    calendar._send_msg = messages.append
+    with param.parameterized.batch_call_watchers(calendar):
+        calendar.clear_events()
+        calendar.add_event(start="2020-01-02", id="2")
+    event = {"start": "2020-01-02", "title": "(no title)", "id": "2"}
+    assert {"type": "updateOptions", "updates": [{"key": "events", "value": [event]}]} in messages
+    assert not any(msg["type"] == "addEvent" for msg in messages)
+
+    messages.clear()
+    with param.parameterized.batch_call_watchers(calendar):
+        calendar.add_event(start="2020-01-03", id="3")
+        calendar.value = [{"start": "2020-01-04", "id": "4"}]
+    assert {"type": "updateOptions", "updates": [{"key": "events", "value": calendar.value}]} in messages
+
+
+def test_calendar_value_triggered():
+    calendar = Calendar(value=[{"start": "2020-01-01", "id": "1"}])
+    messages = []
+    calendar._send_msg = messages.append
+    calendar._handle_msg({"event_change": json.dumps({"event": {"start": "2020-01-02", "id": "1"}})})
+    assert not any(msg["type"] == "updateOptions" for msg in messages)
+
+    calendar.value.append({"start": "2020-01-03", "id": "2"})
+    calendar.param.trigger("value")
+    assert {"type": "updateOptions", "updates": [{"key": "events", "value": calendar.value}]} in messages
+
+
+def test_calendar_get_event_in_view_exact_start():
+    calendar = Calendar()
+    with param.edit_constant(calendar):
+        calendar.events_in_view = [
+            {"start": "2020-01-01T10:00:00+00:00", "title": "event", "id": "24", "allDay": False},
+            {"start": "2020-01-01T10:00:00Z", "title": "event", "id": "25", "allDay": False},
+        ]
+    assert calendar.get_event_in_view("2020-01-01T10:00:00Z", "event").id == "25"
+    assert calendar.get_event_in_view("2020-01-01T11:00:00+01:00", "event").id == "24"
+    # the exact match wins whether or not the parsed starts are cached
+    assert calendar.get_event_in_view("2020-01-01T10:00:00Z", "event").id == "25"
+
+
+def test_calendar_event_set_props():
+    calendar = Calendar()
+    messages = []
+    calendar._send_msg = messages.append
+    event = CalendarEvent(id="25", start="2020-01-01", calendar=calendar)
+    event.set_props(title="event", color="red")
+    assert messages == [{"type": "setProp", "id": "25", "updates": {"title": "event", "color": "red"}}]
+    assert event.title == "event"
+    assert event.props == {"color": "red"}
@@ -0,0 +1,48 @@
+import pytest
+
+from panel_full_calendar.utils import to_camel_case
+from panel_full_calendar.utils import to_camel_case_keys
+from panel_full_calendar.utils import to_snake_case
+from panel_full_calendar.utils import to_snake_case_keys
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [("start", "start"), ("all_day", "allDay"), ("start_recur", "startRecur"), ("background_color", "backgroundColor")],
+)
+def test_to_camel_case(string, expected):
+    assert to_camel_case(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [
+        ("start", "start"),
+        ("allDay", "all_day"),
+        ("startRecur", "start_recur"),
+        ("extendedPropsValue", "extended_props_value"),
+        ("Éa", "_éa"),
+        ("dayÉvent", "day_évent"),
+    ],
+)
+def test_to_snake_case(string, expected):
+    assert to_snake_case(string) == expected
+
+
+def test_to_camel_case_keys():
+    assert to_camel_case_keys({"start": "2020-01-01", "all_day": True}) == {"start": "2020-01-01", "allDay": True}
+
+
+def test_to_snake_case_keys():
+    assert to_snake_case_keys({"start": "2020-01-01", "allDay": True}) == {"start": "2020-01-01", "all_day": True}
+
+
+def test_to_snake_case_keys_unicode():
+    assert to_snake_case_keys({"ℂa": 1}) == {"_ℂa": 1}
+
+
+def test_to_case_keys_unchanged():
+    camel = {"start": "2020-01-01", "allDay": True}
+    snake = {"start": "2020-01-01", "all_day": True}
+    assert to_camel_case_keys(camel) is camel
+    assert to_snake_case_keys(snake) is snake